@@ -21,9 +21,12 @@ from typedsl.schema import (
     # Schema dataclasses
     NodeSchema,
     all_schemas,
+    all_schemas_json,
+    clear_caches,
     # Schema extraction
     extract_type,
     node_schema,
+    node_schema_json,
 )
 from typedsl.serialization import (
     from_dict,
@@ -105,11 +108,14 @@ __all__ = [
     "TypeParameterRef",
     "UnionType",
     "all_schemas",
+    "all_schemas_json",
+    "clear_caches",
     # Schema extraction
     "extract_type",
     "from_dict",
     "from_json",
     "node_schema",
+    "node_schema_json",
     # Serialization
     "to_dict",
     "to_json",
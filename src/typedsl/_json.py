@@ -0,0 +1,71 @@
+r"""JSON encoding backend: orjson when installed, the standard library otherwise.
+
+Both backends decode each other's output to the same values. orjson is only
+used where it agrees with the standard library: anything it would encode
+differently (types such as dates or dataclasses, which the standard library
+rejects) is handed to the standard library instead. orjson also writes NaN and
+infinities as null; wrapped in NonFiniteFloat, as JSONAdapter does for every
+field value, they too are handed to the standard library, which writes them
+as ``NaN`` and ``Infinity``. orjson has no such option for enums and UUIDs,
+which it encodes where the standard library would raise TypeError. The
+encoded text can also differ in formatting, e.g. orjson writes non-ASCII
+characters as UTF-8 rather than ``\u`` escapes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, NoReturn, cast
+
+try:
+    _orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+class NonFiniteFloat(float):
+    """A NaN or infinite float, marked so that dumps() keeps it as NaN/Infinity.
+
+    orjson rejects float subclasses, so a document containing one is encoded
+    by the standard library without dumps() having to search it for them.
+    """
+
+    __slots__ = ()
+
+
+def _reject(obj: object) -> NoReturn:
+    """Refuse to encode a value the standard library would not encode natively."""
+    msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(msg)
+
+
+def dumps(obj: object, *, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if _orjson is not None:
+        # Dataclasses, dates and subclasses of builtins go to _reject, so that
+        # the standard library decides how (and whether) to encode them
+        option = (
+            _orjson.OPT_PASSTHROUGH_DATACLASS
+            | _orjson.OPT_PASSTHROUGH_DATETIME
+            | _orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            return cast("bytes", _orjson.dumps(obj, default=_reject, option=option))
+        except TypeError:
+            pass  # e.g. NonFiniteFloat, non-str keys or integers beyond 64 bits
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document, with orjson when installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # e.g. NaN, which only the stdlib accepts; it reports errors
+    return json.loads(data)
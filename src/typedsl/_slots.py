@@ -0,0 +1,120 @@
+"""Slotted frozen dataclasses for classes configured in ``__init_subclass__``.
+
+``dataclass(slots=True)`` has to build a replacement class, which cannot
+happen from ``__init_subclass__``: the class statement has already bound the
+original. Instead, SlotsMeta declares ``__slots__`` while the class is being
+created and frozen_slotted_dataclass() applies ``dataclass(frozen=True)`` to
+that same class object afterwards.
+
+SlotsMeta derives from ABCMeta so that classes using it can still mix in
+``abc.ABC``, and, like ``dataclass(weakref_slot=True)``, it reserves a
+``__weakref__`` slot so instances stay weakly referenceable. Two classes that
+both declare fields cannot be combined by multiple inheritance, since each
+brings its own slot layout.
+"""
+
+from __future__ import annotations
+
+from abc import ABCMeta
+from dataclasses import KW_ONLY, InitVar, dataclass, fields
+from typing import TYPE_CHECKING, Any, ClassVar, get_origin
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+# Annotations that dataclasses does not turn into instance fields
+_NON_FIELD_NAMES = frozenset({"ClassVar", "InitVar", "KW_ONLY"})
+
+
+def _is_field(annotation: object) -> bool:
+    """Check whether a class-body annotation declares an instance field."""
+    if isinstance(annotation, str):
+        head = annotation.split("[", 1)[0].rsplit(".", 1)[-1].strip()
+        return head not in _NON_FIELD_NAMES
+    if isinstance(annotation, InitVar) or annotation is InitVar:
+        return False
+    if annotation is KW_ONLY:
+        return False
+    return annotation is not ClassVar and get_origin(annotation) is not ClassVar
+
+
+class SlotsMeta(ABCMeta):
+    """Metaclass giving each class body ``__slots__`` for its annotated fields.
+
+    A slot and a class attribute cannot share a name, so field defaults are
+    moved into ``_slot_defaults`` for frozen_slotted_dataclass() to use.
+    A class body that assigns an inherited field without annotating it again
+    would hide that field's slot, so such a class gets a ``__dict__`` to store
+    the field in instead.
+    """
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        /,
+        **kwargs: object,
+    ) -> SlotsMeta:
+        """Create the class with ``__slots__`` derived from its annotations."""
+        annotations: dict[str, object] | None = namespace.get("__annotations__")
+        # Lazily evaluated annotations (PEP 649) cannot be inspected here; such
+        # classes keep a ``__dict__`` and behave exactly as before.
+        lazy = annotations is None and any(
+            key.startswith("__annotate") for key in namespace
+        )
+        if "__slots__" not in namespace and not lazy:
+            slots = tuple(
+                field_name
+                for field_name, annotation in (annotations or {}).items()
+                if _is_field(annotation)
+            )
+            namespace["_slot_defaults"] = {
+                slot: namespace.pop(slot) for slot in slots if slot in namespace
+            }
+            if not any(base.__weakrefoffset__ for base in bases):
+                slots += ("__weakref__",)
+            if not any(base.__dictoffset__ for base in bases) and any(
+                attr in namespace for attr in _inherited_slots(bases)
+            ):
+                slots += ("__dict__",)
+            namespace["__slots__"] = slots
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+def _inherited_slots(bases: tuple[type, ...]) -> set[str]:
+    """Collect the slot names declared anywhere in the bases' MROs."""
+    inherited: set[str] = set()
+    for base in bases:
+        for cls in base.__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            inherited.update((slots,) if isinstance(slots, str) else slots)
+    return inherited
+
+
+def frozen_slotted_dataclass(cls: type) -> None:
+    """Apply ``dataclass(frozen=True)`` in place to a class built by SlotsMeta."""
+    defaults: dict[str, Any] = cls.__dict__.get("_slot_defaults", {})
+    descriptors = {slot: cls.__dict__[slot] for slot in defaults}
+    # dataclass() reads defaults from class attributes and writes them back,
+    # so lend it the defaults and then reinstate the slot descriptors.
+    for slot, default in defaults.items():
+        type.__setattr__(cls, slot, default)
+    dataclass(frozen=True)(cls)
+    for slot, descriptor in descriptors.items():
+        type.__setattr__(cls, slot, descriptor)
+
+    # Copy and pickle restore slots through setattr, which frozen instances
+    # reject; mirror what dataclass(slots=True) installs for this case.
+    if "__getstate__" not in cls.__dict__:
+        type.__setattr__(cls, "__getstate__", _getstate)
+        type.__setattr__(cls, "__setstate__", _setstate)
+
+
+def _getstate(self: DataclassInstance) -> list[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _setstate(self: DataclassInstance, state: list[Any]) -> None:
+    for f, value in zip(fields(self), state, strict=True):
+        object.__setattr__(self, f.name, value)
@@ -4,14 +4,43 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import fields
-from typing import TYPE_CHECKING, Any, TypedDict
+from math import isfinite
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, cast
 
+from typedsl._json import NonFiniteFloat
 from typedsl.nodes import Node, Ref
 from typedsl.types import TypeDef
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from typedsl.schema import NodeSchema
 
+    type _ValueSerializer = Callable[[Any, Any], Any]
+    type _NodeSerializer = Callable[
+        [Node[Any], Callable[[Any], Any]],
+        dict[str, Any],
+    ]
+    type _NodeDeserializer = Callable[
+        [dict[str, Any], Callable[[Any], Any]],
+        Node[Any],
+    ]
+
+# Short tags and keys emitted for TypeDefs by JSONAdapter(compact=True)
+_COMPACT_TAGS = {
+    "int": "i",
+    "float": "f",
+    "str": "s",
+    "list": "l",
+    "dict": "d",
+    "node": "n",
+    "ref": "r",
+    "union": "u",
+}
+_COMPACT_KEYS = {"tag": "t", "element": "e", "key": "k", "value": "v"}
+_EXPANDED_TAGS = {short: tag for tag, short in _COMPACT_TAGS.items()}
+_EXPANDED_KEYS = {short: key for key, short in _COMPACT_KEYS.items()}
+
 
 class SerializedFieldSchema(TypedDict):
     """Serialized field schema structure."""
@@ -59,18 +88,52 @@ class FormatAdapter(ABC):
         ...
 
 
+# JSON scalar types, which (de)serialize to themselves
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+# Scalars serialized as they are; floats go through _serialize_float instead
+_PLAIN_SCALARS = _SCALARS - {float}
+
+
+def _serialize_plain(_adapter: JSONAdapter, value: Any) -> Any:
+    return value
+
+
+def _serialize_float(_adapter: JSONAdapter, value: float) -> Any:
+    # NaN and infinities are marked so that orjson does not encode them as null
+    return value if isfinite(value) else NonFiniteFloat(value)
+
+
+def _serialize_ref(_adapter: JSONAdapter, value: Ref[Any]) -> Any:
+    return {"tag": "ref", "id": value.id}
+
+
 class JSONAdapter(FormatAdapter):
-    """JSON serialization adapter."""
+    """JSON serialization adapter.
+
+    With ``compact=True``, TypeDefs (including those inside node schemas) are
+    written with single-character tags and keys, e.g. ``list[int]`` becomes
+    ``{"e": {"t": "i"}, "t": "l"}``. Nodes are unaffected since their tags
+    and field names are user-defined. TypeDefs held by node fields keep the
+    full form too: without a schema for those fields, their ``"tag"`` is what
+    tells them apart from plain dicts.
+    """
+
+    def __init__(self, *, compact: bool = False) -> None:
+        """Initialize the adapter.
+
+        Args:
+            compact: Use short tags and keys for TypeDef dictionaries
+
+        """
+        self.compact = compact
 
     def serialize_node(self, node: Node[Any]) -> dict[str, Any]:
         """Serialize a Node to a JSON-compatible dictionary."""
-        result = {
-            field.name: self._serialize_value(getattr(node, field.name))
-            for field in fields(node)
-            if not field.name.startswith("_")
-        }
-        result["tag"] = type(node).tag
-        return result
+        node_cls = type(node)
+        serializer = node_cls.__dict__.get("_serializer")
+        if serializer is None:
+            serializer = _compile_node_serializer(node_cls)
+        return serializer(node, self._serialize_value)
 
     def deserialize_node(self, data: dict[str, Any]) -> Node[Any]:
         """Deserialize a JSON-compatible dictionary to a Node."""
@@ -80,15 +143,19 @@ class JSONAdapter(FormatAdapter):
             msg = f"Unknown node tag: {tag}"
             raise ValueError(msg)
 
-        field_values = {
-            field.name: self._deserialize_value(data[field.name])
-            for field in fields(node_cls)
-            if not field.name.startswith("_") and field.name in data
-        }
-        return node_cls(**field_values)
+        deserializer = node_cls.__dict__.get("_deserializer")
+        if deserializer is None:
+            deserializer = _compile_node_deserializer(node_cls)
+        return deserializer(data, self._deserialize_value)
 
     def deserialize_typedef(self, data: dict[str, Any]) -> TypeDef:
         """Deserialize a JSON-compatible dictionary to a TypeDef."""
+        if self.compact:
+            data = _expand_compact(data)
+        return self._deserialize_typedef(data)
+
+    def _deserialize_typedef(self, data: dict[str, Any]) -> TypeDef:
+        """Deserialize a TypeDef dictionary in full form."""
         tag = data["tag"]
         typedef_cls = TypeDef.registry.get(tag)
         if typedef_cls is None:
@@ -97,17 +164,21 @@ class JSONAdapter(FormatAdapter):
 
         field_values = {
             field.name: self._deserialize_value(data[field.name])
-            for field in fields(typedef_cls)
-            if not field.name.startswith("_") and field.name in data
+            for field in typedef_cls._public_fields
+            if field.name in data
         }
         return typedef_cls(**field_values)
 
     def serialize_typedef(self, typedef: TypeDef) -> dict[str, Any]:
         """Serialize a TypeDef to a JSON-compatible dictionary."""
+        result = self._serialize_typedef(typedef)
+        return _compact(result) if self.compact else result
+
+    def _serialize_typedef(self, typedef: TypeDef) -> dict[str, Any]:
+        """Serialize a TypeDef to a dictionary in full form."""
         result = {
             field.name: self._serialize_value(getattr(typedef, field.name))
-            for field in fields(typedef)
-            if not field.name.startswith("_")
+            for field in type(typedef)._public_fields
         }
         result["tag"] = type(typedef).tag
         return result
@@ -126,31 +197,188 @@ class JSONAdapter(FormatAdapter):
         }
 
     def _serialize_value(self, value: Any) -> Any:
-        if isinstance(value, Node):
-            return self.serialize_node(value)
-        if isinstance(value, Ref):
-            return {"tag": "ref", "id": value.id}
-        if isinstance(value, TypeDef):
-            return self.serialize_typedef(value)
-        if isinstance(value, list | tuple):
-            return [self._serialize_value(item) for item in value]
-        if isinstance(value, dict):
-            return {k: self._serialize_value(v) for k, v in value.items()}
-        return value
+        value_type = type(value)
+        if value_type in _PLAIN_SCALARS:  # most field values; returned as they are
+            return value
+        if value_type is float:  # marked if non-finite, see _serialize_float
+            return value if isfinite(value) else NonFiniteFloat(value)
+        serializer = self._serializers.get(value_type)
+        if serializer is None:
+            serializer = self._serializer_for(value_type)
+        return serializer(self, value)
+
+    def _serializer_for(self, value_type: type) -> _ValueSerializer:
+        """Find and remember the serializer for values of exactly value_type."""
+        serializer = next(
+            (
+                serializer
+                for base, serializer in self._serializer_bases
+                if issubclass(value_type, base)
+            ),
+            _serialize_plain,
+        )
+        self._serializers[value_type] = serializer
+        return serializer
+
+    def _serialize_node_value(self, value: Node[Any]) -> Any:
+        return self.serialize_node(value)
+
+    def _serialize_typedef_value(self, value: TypeDef) -> Any:
+        return self._serialize_typedef(value)
+
+    def _serialize_items(self, value: list[Any] | tuple[Any, ...]) -> Any:
+        return [self._serialize_value(item) for item in value]
+
+    def _serialize_entries(self, value: dict[Any, Any]) -> Any:
+        return {k: self._serialize_value(v) for k, v in value.items()}
+
+    # Checked in order for a value type not yet in _serializers
+    _serializer_bases: ClassVar[tuple[tuple[type, _ValueSerializer], ...]] = (
+        (float, _serialize_float),
+        (Node, _serialize_node_value),
+        (Ref, _serialize_ref),
+        (TypeDef, _serialize_typedef_value),
+        (list, _serialize_items),
+        (tuple, _serialize_items),
+        (dict, _serialize_entries),
+    )
+    # Serializer per exact value type, filled in as new value types are seen;
+    # one type() lookup replaces a chain of isinstance checks
+    _serializers: ClassVar[dict[type, _ValueSerializer]] = {
+        Ref: _serialize_ref,
+        list: _serialize_items,
+        dict: _serialize_entries,
+    }
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each subclass its own serializer table.
+
+        A subclass may change _serializer_bases, so the table is filled in
+        from its own bases rather than shared with the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._serializers = {}
 
     def _deserialize_value(self, value: Any) -> Any:
-        if isinstance(value, dict) and "tag" in value:
-            tag = value["tag"]
-            if tag == "ref":
-                return Ref(id=value["id"])
-            if tag in Node.registry:
-                return self.deserialize_node(value)
-            if tag in TypeDef.registry:
-                return self.deserialize_typedef(value)
-            msg = f"Unknown tag: {tag}"
-            raise ValueError(msg)
-        if isinstance(value, list):
-            return [self._deserialize_value(item) for item in value]
+        if type(value) in _SCALARS:
+            return value
         if isinstance(value, dict):
+            if "tag" in value:
+                return self._deserialize_tagged(value)
             return {k: self._deserialize_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._deserialize_value(item) for item in value]
+        return value
+
+    def _deserialize_tagged(self, value: dict[str, Any]) -> Any:
+        tag = value["tag"]
+        if tag == "ref":
+            return Ref(id=value["id"])
+        if tag in Node.registry:
+            return self.deserialize_node(value)
+        if tag in TypeDef.registry:
+            return self._deserialize_typedef(value)
+        msg = f"Unknown tag: {tag}"
+        raise ValueError(msg)
+
+
+def _compile_node_serializer(node_cls: type[Node[Any]]) -> _NodeSerializer:
+    """Generate and cache a serializer specialized to one node class.
+
+    The generated function reads each public field by attribute name and
+    passes it through the adapter's value serializer, producing the same
+    dictionary as a loop over the dataclass fields without the per-field
+    reflection.
+    """
+    items = "".join(
+        f"{f.name!r}: serialize(node.{f.name}), " for f in node_cls._public_fields
+    )
+    source = f"def serialize_node(node, serialize):\n    return {{{items}'tag': tag}}\n"
+    namespace: dict[str, Any] = {"tag": node_cls.tag}
+    exec(source, namespace)  # noqa: S102
+    serializer = cast("_NodeSerializer", namespace["serialize_node"])
+    setattr(node_cls, "_serializer", serializer)  # noqa: B010
+    return serializer
+
+
+def _compile_node_deserializer(node_cls: type[Node[Any]]) -> _NodeDeserializer:
+    """Generate and cache a deserializer specialized to one node class.
+
+    When every public field is present (the usual case) the generated function
+    passes each one to the constructor by keyword; otherwise it falls back to
+    passing only the fields found, leaving defaults and errors to the class.
+
+    If the dataclass ``__init__`` would do nothing beyond assigning the public
+    fields, the complete case skips it and fills a bare instance directly.
+    """
+    names = [f.name for f in node_cls._public_fields]
+    present = " and ".join(f"{name!r} in data" for name in names) or "True"
+    if _assigns_fields_only(node_cls):
+        build = "".join(
+            f"        set_field(node, {name!r}, deserialize(data[{name!r}]))\n"
+            for name in names
+        )
+        complete = f"        node = new(cls)\n{build}        return node\n"
+    else:
+        kwargs = ", ".join(f"{name}=deserialize(data[{name!r}])" for name in names)
+        complete = f"        return cls({kwargs})\n"
+    source = (
+        "def deserialize_node(data, deserialize):\n"
+        f"    if {present}:\n"
+        f"{complete}"
+        "    return cls(**{\n"
+        "        name: deserialize(data[name]) for name in names if name in data\n"
+        "    })\n"
+    )
+    namespace: dict[str, Any] = {
+        "cls": node_cls,
+        "names": tuple(names),
+        "new": object.__new__,
+        "set_field": object.__setattr__,
+    }
+    exec(source, namespace)  # noqa: S102
+    deserializer = cast("_NodeDeserializer", namespace["deserialize_node"])
+    setattr(node_cls, "_deserializer", deserializer)  # noqa: B010
+    return deserializer
+
+
+def _assigns_fields_only(node_cls: type[Node[Any]]) -> bool:
+    """Check whether constructing node_cls only assigns its public fields."""
+    all_fields = fields(node_cls)
+    return (
+        node_cls._plain_init
+        and node_cls.__new__ is object.__new__
+        and not hasattr(node_cls, "__post_init__")
+        and len(all_fields) == len(node_cls._public_fields)
+        and all(f.init for f in all_fields)
+    )
+
+
+def _compact(value: Any) -> Any:
+    """Shorten the tags and keys of a full-form TypeDef dictionary.
+
+    Every dict nested in a TypeDef is itself a TypeDef, so the whole value is
+    compacted recursively.
+    """
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    compacted = {_COMPACT_KEYS.get(k, k): _compact(v) for k, v in value.items()}
+    compacted["t"] = _COMPACT_TAGS.get(compacted["t"], compacted["t"])
+    return compacted
+
+
+def _expand_compact(value: Any) -> Any:
+    """Restore full tags and keys in a compact TypeDef dictionary.
+
+    Every dict nested in a TypeDef is itself a TypeDef, so the whole value is
+    expanded recursively. Already-expanded input is returned unchanged.
+    """
+    if isinstance(value, list):
+        return [_expand_compact(item) for item in value]
+    if not isinstance(value, dict):
         return value
+    expanded = {_EXPANDED_KEYS.get(k, k): _expand_compact(v) for k, v in value.items()}
+    expanded["tag"] = _EXPANDED_TAGS.get(expanded["tag"], expanded["tag"])
+    return expanded
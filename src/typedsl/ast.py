@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
+from typedsl._json import dumps, loads
 from typedsl.serialization import from_dict, to_dict
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from _typeshed import SupportsWrite
+
     from typedsl.nodes import Node, Ref
 
 
@@ -43,14 +45,28 @@ class AST:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize AST to dictionary."""
+        # map() calls to_dict from C, with no per-node comprehension bytecode
+        nodes = self.nodes
         return {
             "root": self.root,
-            "nodes": {k: to_dict(v) for k, v in self.nodes.items()},
+            "nodes": dict(zip(nodes, map(to_dict, nodes.values()), strict=True)),
         }
 
     def to_json(self) -> str:
         """Serialize AST to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps(self.to_dict(), indent=True).decode()
+
+    def to_json_stream(self, stream: SupportsWrite[bytes]) -> None:
+        """Write the AST to a binary stream as compact UTF-8 JSON.
+
+        The document matches to_json() without the indentation, but nodes are
+        encoded one at a time, so the whole AST is never held as a dictionary.
+        """
+        stream.write(b'{"root":' + dumps(self.root) + b',"nodes":{')
+        for index, (node_id, node) in enumerate(self.nodes.items()):
+            separator = b"," if index else b""
+            stream.write(separator + dumps(node_id) + b":" + dumps(to_dict(node)))
+        stream.write(b"}}")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AST:
@@ -74,13 +90,14 @@ class AST:
             msg = "Missing required key 'nodes' in AST data"
             raise KeyError(msg)
 
-        nodes = {k: cast("Node[Any]", from_dict(v)) for k, v in data["nodes"].items()}
-        return cls(data["root"], nodes)
+        serialized = data["nodes"]
+        nodes = dict(zip(serialized, map(from_dict, serialized.values()), strict=True))
+        return cls(data["root"], cast("dict[str, Node[Any]]", nodes))
 
     @classmethod
     def from_json(cls, s: str) -> AST:
         """Deserialize AST from JSON string."""
-        return cls.from_dict(json.loads(s))
+        return cls.from_dict(loads(s))
 
 
 class Interpreter[Ctx, R](ABC):
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, dataclass_transform
+import sys
+from dataclasses import Field, dataclass, fields
+from typing import Any, ClassVar, dataclass_transform, get_args, get_origin
+
+from typedsl._slots import SlotsMeta, frozen_slotted_dataclass
 
 
 @dataclass(frozen=True)
@@ -15,19 +18,36 @@ class Ref[X]:
 
 @dataclass(frozen=True)
 @dataclass_transform(frozen_default=True)
-class Node[T]:
-    """Base for AST nodes. T is return type."""
+class Node[T](metaclass=SlotsMeta):
+    """Base for AST nodes. T is return type.
+
+    Subclasses are frozen dataclasses with ``__slots__``, so instances carry
+    no per-instance ``__dict__``. A subclass that needs one (for example for
+    ``functools.cached_property``) can declare ``__slots__ = ("__dict__",)``.
+    """
 
     tag: ClassVar[str]
     signature: ClassVar[dict[str, Any]]
     registry: ClassVar[dict[str, type[Node[Any]]]] = {}
+    _registry_version: ClassVar[int] = 0  # bumped on every new registration
+    _public_fields: ClassVar[tuple[Field[Any], ...]] = ()
+    _node_returns: ClassVar[Any] = type(None)
+    _is_node: ClassVar[bool] = True  # inherited marker, cheaper than issubclass
+    _plain_init: ClassVar[bool] = True  # __init__ is the dataclass-generated one
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Register node subclass with automatic tag derivation."""
-        dataclass(frozen=True)(cls)
+        # dataclass() keeps an __init__ written in the class body
+        cls._plain_init = "__init__" not in cls.__dict__
+        frozen_slotted_dataclass(cls)
+        cls._public_fields = tuple(f for f in fields(cls) if not f.name.startswith("_"))
+        cls._node_returns = _resolve_returns(cls)
 
         cls.signature = kwargs
-        cls.tag = ".".join(map(str, kwargs.values())) if kwargs else cls.__name__
+        # Interned so the registry and every serialized node share one object
+        cls.tag = sys.intern(
+            ".".join(map(str, kwargs.values())) if kwargs else cls.__name__,
+        )
 
         if (existing := Node.registry.get(cls.tag)) and existing is not cls:
             msg = (
@@ -36,7 +56,18 @@ class Node[T]:
             )
             raise ValueError(msg)
 
-        Node.registry[cls.tag] = cls
+        if existing is None:
+            Node.registry[cls.tag] = cls
+            Node._registry_version += 1
+
+
+def _resolve_returns(cls: type[Node[Any]]) -> Any:
+    """Find the return type annotation T from a Node[T] base, or NoneType."""
+    for base in getattr(cls, "__orig_bases__", ()):
+        origin = get_origin(base)
+        if getattr(origin, "_is_node", False) and get_args(base):
+            return get_args(base)[0]
+    return type(None)
 
 
 type NodeRef[T] = Ref[Node[T]]
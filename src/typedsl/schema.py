@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import types
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, fields
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import (
+    Annotated,
     Any,
     Literal,
     TypeAliasType,
     TypeVar,
     Union,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
 )
 
+from typedsl._json import dumps
+from typedsl.adapters import JSONAdapter
 from typedsl.nodes import Node, Ref
 from typedsl.types import (
     BoolType,
@@ -44,6 +49,7 @@ from typedsl.types import (
     TypeDef,
     TypeParameter,
     UnionType,
+    clear_substitution_caches,
     substitute_type_params,
 )
 
@@ -74,7 +80,46 @@ _TYPE_MAP: dict[type, type[TypeDef]] = {
 
 def _get_field_count(typedef_cls: type[TypeDef]) -> int:
     """Get the number of public fields from a TypeDef class."""
-    return sum(1 for f in fields(typedef_cls) if not f.name.startswith("_"))
+    return len(typedef_cls._public_fields)
+
+
+# Shared instances for field-less TypeDefs: they are frozen and all equal, so a
+# single dict hit replaces the full dispatch for the most common annotations.
+_BUILTIN_PRIMITIVES: dict[Any, TypeDef] = {
+    py_type: typedef_cls()
+    for py_type, typedef_cls in _TYPE_MAP.items()
+    if _get_field_count(typedef_cls) == 0
+}
+_NONE = _BUILTIN_PRIMITIVES[type(None)]
+
+# The shortcut table actually consulted: registered external types take
+# precedence over the built-in mapping, so they are left out of it.
+_PRIMITIVES: dict[Any, TypeDef] = dict(_BUILTIN_PRIMITIVES)
+
+# Shared composite TypeDefs keyed on (class, identity of children). Children are
+# themselves shared, so identity is a sound key and, unlike value equality,
+# keeps Literal[1] and Literal[True] apart.
+_INTERNED: dict[tuple[Any, ...], TypeDef] = {}
+_INTERNED_MAX = 16384
+
+
+def _interned[T: TypeDef](
+    typedef_cls: type[T],
+    *args: TypeDef | tuple[TypeDef, ...],
+) -> T:
+    """Return the shared instance of ``typedef_cls(*args)``."""
+    key = (
+        typedef_cls,
+        *(tuple(map(id, arg)) if isinstance(arg, tuple) else id(arg) for arg in args),
+    )
+    cached = _INTERNED.get(key)
+    if cached is None:
+        # Sharing is an optimization only, so when the table is full it is
+        # simply started afresh rather than tracking per-entry use
+        if len(_INTERNED) >= _INTERNED_MAX:
+            _INTERNED.clear()
+        cached = _INTERNED[key] = typedef_cls(*args)
+    return cast("T", cached)
 
 
 @dataclass(frozen=True)
@@ -97,12 +142,64 @@ class NodeSchema:
 
 
 def extract_type(py_type: Any) -> TypeDef:
-    """Convert Python type annotation to TypeDef."""
-    origin = get_origin(py_type)
-    args = get_args(py_type)
+    """Convert Python type annotation to TypeDef.
+
+    Results are memoized: the mapping is pure and TypeDefs are frozen, so
+    repeated annotations (e.g. ``int`` or ``list[int]`` across many node
+    fields) resolve with a single cache lookup. Registering an external type
+    discards the memoized results, since it can change them.
+    """
+    if TypeDef._external_version != _external_version:
+        _sync_external_types()
+    try:
+        if (primitive := _PRIMITIVES.get(py_type)) is not None:
+            return primitive
+    except TypeError:  # unhashable annotation
+        return _extract_type_uncached(py_type)
+    # Unions compare equal regardless of option order, so the repr keeps the
+    # annotation's own ordering in the cache key.
+    return _extract_type_cached(py_type, repr(py_type))
+
+
+# TypeDef._external_version that _PRIMITIVES and the memoized results reflect
+_external_version = 0
+
+
+def _sync_external_types() -> None:
+    """Drop memoized extractions made before the latest external registration."""
+    global _external_version  # noqa: PLW0603
+    clear_caches()
+    _PRIMITIVES.clear()
+    _PRIMITIVES.update(
+        (py_type, typedef)
+        for py_type, typedef in _BUILTIN_PRIMITIVES.items()
+        if TypeDef.get_registered_type(py_type) is None
+    )
+    _external_version = TypeDef._external_version
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_type_cached(py_type: Any, _key: str) -> TypeDef:
+    return _extract_type_uncached(py_type)
+
+
+def _extract_type_uncached(py_type: Any) -> TypeDef:
+    """Convert Python type annotation to TypeDef without memoization."""
+    # Classes (node classes, registered external types) never have an origin
+    # or arguments, so skip the typing introspection calls for them. Classes
+    # can have their own metaclass, so this cannot be an exact type check.
+    # The metaclass is tested rather than isinstance(py_type, type), which
+    # builtin generic aliases such as list[int] satisfy through their origin.
+    origin: Any
+    args: tuple[Any, ...]
+    if issubclass(type(py_type), type):
+        origin, args = None, ()
+    else:
+        origin = get_origin(py_type)
+        args = get_args(py_type)
 
     # Handle TypeVar
-    if isinstance(py_type, TypeVar):
+    if type(py_type) is TypeVar:
         bound = py_type.__bound__
         return TypeParameter(
             name=py_type.__name__,
@@ -115,7 +212,7 @@ def extract_type(py_type: Any) -> TypeDef:
         return custom_typedef
 
     # Expand PEP 695 type aliases
-    if isinstance(origin, TypeAliasType):
+    if type(origin) is TypeAliasType:
         type_params = origin.__type_params__
         if len(type_params) != len(args):
             msg = (
@@ -138,59 +235,105 @@ def extract_type(py_type: Any) -> TypeDef:
                 f"{type_name} requires {field_count} type argument(s), got {len(args)}"
             )
             raise ValueError(msg)
-        return typedef_cls(*(extract_type(arg) for arg in args))
-
-    # Tuple (heterogeneous, variable-length elements)
-    if origin is tuple:
-        if not args:
-            msg = "tuple type must have element types"
-            raise ValueError(msg)
-        return TupleType(elements=tuple(extract_type(arg) for arg in args))
+        return _interned(typedef_cls, *(extract_type(arg) for arg in args))
 
-    # Literal values
-    if origin is Literal:
-        if not args:
-            msg = "Literal type must have values"
-            raise ValueError(msg)
-        for val in args:
-            if not isinstance(val, str | int | bool):
-                msg = f"Literal values must be str, int, or bool, got {type(val)}"
-                raise TypeError(msg)
-        return LiteralType(values=args)
+    # Origin-keyed special forms: tuple, Literal, Ref and unions
+    if (handler := _ORIGIN_HANDLERS.get(origin)) is not None:
+        return handler(args)
 
     # Node types
-    if origin is not None and isinstance(origin, type) and issubclass(origin, Node):
-        return NodeType(extract_type(args[0]) if args else NoneType())
-    if isinstance(py_type, type) and issubclass(py_type, Node):
-        return NodeType(_extract_node_returns(py_type))
-
-    # Ref type
-    if origin is Ref:
-        return RefType(extract_type(args[0]) if args else NoneType())
-
-    # Union types
-    if isinstance(py_type, types.UnionType) or origin is Union:
-        return UnionType(tuple(extract_type(a) for a in args))
+    if getattr(origin, "_is_node", False):
+        return _interned(NodeType, extract_type(args[0]) if args else _NONE)
+    if getattr(py_type, "_is_node", False):
+        return _interned(NodeType, _extract_node_returns(py_type))
 
     msg = f"Cannot extract type from: {py_type}"
     raise ValueError(msg)
 
 
+def _extract_tuple(args: tuple[Any, ...]) -> TypeDef:
+    """Tuple (heterogeneous, variable-length elements)."""
+    if not args:
+        msg = "tuple type must have element types"
+        raise ValueError(msg)
+    return _interned(TupleType, tuple(extract_type(arg) for arg in args))
+
+
+def _extract_literal(args: tuple[Any, ...]) -> TypeDef:
+    """Literal values."""
+    if not args:
+        msg = "Literal type must have values"
+        raise ValueError(msg)
+    for val in args:
+        if not isinstance(val, str | int | bool):
+            msg = f"Literal values must be str, int, or bool, got {type(val)}"
+            raise TypeError(msg)
+    return LiteralType(values=args)
+
+
+def _extract_ref(args: tuple[Any, ...]) -> TypeDef:
+    """Ref type."""
+    return _interned(RefType, extract_type(args[0]) if args else _NONE)
+
+
+def _extract_union(args: tuple[Any, ...]) -> TypeDef:
+    """Union types (both ``X | Y`` and ``Union[X, Y]``)."""
+    return _interned(UnionType, tuple(extract_type(a) for a in args))
+
+
+_ORIGIN_HANDLERS: dict[Any, Callable[[tuple[Any, ...]], TypeDef]] = {
+    tuple: _extract_tuple,
+    Literal: _extract_literal,
+    Ref: _extract_ref,
+    types.UnionType: _extract_union,
+    Union: _extract_union,
+}
+
+
 def _extract_node_returns(cls: type[Node[Any]]) -> TypeDef:
     """Extract the return type from a Node class definition."""
-    for base in getattr(cls, "__orig_bases__", ()):
-        origin = get_origin(base)
-        is_node_origin = isinstance(origin, type) and issubclass(origin, Node)
-        if origin is None or not is_node_origin:
-            continue
-        if args := get_args(base):
-            return extract_type(args[0])
-    return NoneType()
+    return extract_type(cls._node_returns)
+
+
+def _is_evaluated(hint: Any) -> bool:
+    """Check whether get_type_hints would return an annotation unchanged.
+
+    Strings and forward references (at any depth) need evaluating, ``None``
+    becomes ``NoneType`` and ``Annotated`` is stripped, so none of them are.
+    """
+    if isinstance(hint, type) or type(hint) in _EVALUATED_LEAVES:
+        return True
+    if type(hint) is list:  # the parameter list of Callable[[...], R]
+        return all(map(_is_evaluated, hint))
+    origin = get_origin(hint)
+    if origin is None or origin is Annotated:
+        return False
+    # Literal arguments are values, not annotations
+    return origin is Literal or all(map(_is_evaluated, get_args(hint)))
+
+
+# Annotations that get_type_hints returns as they are, other than classes
+_EVALUATED_LEAVES = frozenset({TypeVar, TypeAliasType, type(Ellipsis)})
 
 
 def node_schema(cls: type[Node[Any]]) -> NodeSchema:
-    """Get schema for a node class."""
-    hints = get_type_hints(cls)
+    """Get schema for a node class.
+
+    The schema is cached on the class itself. Node classes are immutable after
+    definition, but registering an external type can change how their fields
+    are extracted, so the schema is recomputed after a new registration.
+    """
+    version = TypeDef._external_version
+    cached: tuple[int, NodeSchema] | None = cls.__dict__.get("_schema_cache")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Field annotations are usually already evaluated; get_type_hints (which
+    # walks the MRO and evaluates every annotation) is only needed when one of
+    # them is not in the form it would return.
+    hints: dict[str, Any] = {f.name: f.type for f in cls._public_fields}
+    if not all(map(_is_evaluated, hints.values())):
+        hints = get_type_hints(cls)
 
     type_params: list[TypeParameter] = []
     if hasattr(cls, "__type_params__"):
@@ -206,19 +349,99 @@ def node_schema(cls: type[Node[Any]]) -> NodeSchema:
 
     node_fields = (
         FieldSchema(name=f.name, type=extract_type(hints[f.name]))
-        for f in fields(cls)
-        if not f.name.startswith("_")
+        for f in cls._public_fields
     )
 
-    return NodeSchema(
+    schema = NodeSchema(
         tag=cls.tag,
         signature=cls.signature,
         type_params=tuple(type_params),
         returns=_extract_node_returns(cls),
         fields=tuple(node_fields),
     )
+    setattr(cls, "_schema_cache", (version, schema))  # noqa: B010
+    return schema
+
+
+_adapter = JSONAdapter()
+
+
+def node_schema_json(cls: type[Node[Any]]) -> bytes:
+    """Get the JSON-encoded schema for a node class.
+
+    Encoded with orjson when it is installed. The bytes are cached on the
+    class alongside the schema itself, so repeat calls do no work until an
+    external type is registered.
+    """
+    version = TypeDef._external_version
+    cached: tuple[int, bytes] | None = cls.__dict__.get("_schema_json")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    encoded = dumps(_adapter.serialize_node_schema(node_schema(cls)))
+    setattr(cls, "_schema_json", (version, encoded))  # noqa: B010
+    return encoded
+
+
+# (registry and external type versions, schemas) from the last all_schemas()
+_all_schemas_cache: tuple[tuple[int, int], dict[str, NodeSchema]] = ((-1, -1), {})
+
+
+def _registry_versions() -> tuple[int, int]:
+    """Versions of the node registry and the external type registry."""
+    return Node._registry_version, TypeDef._external_version
 
 
 def all_schemas() -> dict[str, NodeSchema]:
-    """Get all registered node schemas."""
-    return {tag: node_schema(cls) for tag, cls in Node.registry.items()}
+    """Get all registered node schemas.
+
+    The result is rebuilt only when new node classes or external types have
+    been registered since the previous call; otherwise the cached schemas are
+    reused.
+    """
+    global _all_schemas_cache  # noqa: PLW0603
+    version, schemas = _all_schemas_cache
+    if version != _registry_versions():
+        version = _registry_versions()
+        schemas = {tag: node_schema(cls) for tag, cls in Node.registry.items()}
+        _all_schemas_cache = (version, schemas)
+    return dict(schemas)
+
+
+# (registry and external type versions, encoded schemas) from the last call
+_all_schemas_json_cache: tuple[tuple[int, int], bytes] = ((-1, -1), b"")
+
+
+def all_schemas_json() -> bytes:
+    """Get all registered node schemas as one JSON object keyed by tag.
+
+    The whole registry is encoded in a single pass, and the bytes are reused
+    until new node classes or external types are registered.
+    """
+    global _all_schemas_json_cache  # noqa: PLW0603
+    version, encoded = _all_schemas_json_cache
+    if version != _registry_versions():
+        version = _registry_versions()
+        encoded = dumps(
+            {
+                tag: _adapter.serialize_node_schema(schema)
+                for tag, schema in all_schemas().items()
+            },
+        )
+        _all_schemas_json_cache = (version, encoded)
+    return encoded
+
+
+def clear_caches() -> None:
+    """Drop memoized type extractions, substitutions and registry-wide schemas.
+
+    Registering an external type calls this automatically, since it changes
+    extraction results; calling it directly frees the memory and gives tests
+    a clean slate. Schemas cached on individual node classes live and die
+    with those classes, and are recomputed after a registration.
+    """
+    global _all_schemas_cache, _all_schemas_json_cache  # noqa: PLW0603
+    _extract_type_cached.cache_clear()
+    _INTERNED.clear()
+    clear_substitution_caches()
+    _all_schemas_cache = ((-1, -1), {})
+    _all_schemas_json_cache = ((-1, -1), b"")
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, cast
 
+from typedsl._json import dumps, loads
 from typedsl.adapters import JSONAdapter
 from typedsl.nodes import Node, Ref
 from typedsl.types import TypeDef
@@ -26,10 +26,12 @@ def to_dict(obj: Node[Any] | Ref[Any] | TypeDef) -> dict[str, Any]:
         ValueError: If object type cannot be serialized
 
     """
+    # The inherited marker is cheaper than isinstance() for the common case;
+    # it is read from the type, since node classes carry it too
+    if getattr(type(obj), "_is_node", False):
+        return _adapter.serialize_node(cast("Node[Any]", obj))
     if isinstance(obj, Ref):
         return {"tag": "ref", "id": obj.id}
-    if isinstance(obj, Node):
-        return _adapter.serialize_node(obj)
     if isinstance(obj, TypeDef):
         return _adapter.serialize_typedef(obj)
     msg = f"Cannot serialize object of type {type(obj).__name__}"
@@ -95,7 +97,7 @@ def to_json(obj: Node[Any] | Ref[Any] | TypeDef) -> str:
         ValueError: If object type cannot be serialized
 
     """
-    return json.dumps(to_dict(obj), indent=2)
+    return dumps(to_dict(obj), indent=True).decode()
 
 
 def from_json(s: str) -> Node[Any] | Ref[Any] | TypeDef:
@@ -113,4 +115,4 @@ def from_json(s: str) -> Node[Any] | Ref[Any] | TypeDef:
         ValueError: If tag is not recognized
 
     """
-    return from_dict(json.loads(s))
+    return from_dict(loads(s))
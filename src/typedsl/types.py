@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+import sys
 import types
-from dataclasses import dataclass
+import weakref
+from collections import abc
+from dataclasses import Field, dataclass, fields
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    TypeVar,
+    Union,
     dataclass_transform,
     get_args,
     get_origin,
 )
 
+from typedsl._slots import SlotsMeta, frozen_slotted_dataclass
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExternalTypeRecord[T]:
     """Record for external type registration."""
 
@@ -30,17 +39,31 @@ class ExternalTypeRecord[T]:
 
 @dataclass(frozen=True)
 @dataclass_transform(frozen_default=True)
-class TypeDef:
-    """Base for type definitions."""
+class TypeDef(metaclass=SlotsMeta):
+    """Base for type definitions.
+
+    Subclasses are frozen dataclasses with ``__slots__``, so instances carry
+    no per-instance ``__dict__``.
+    """
 
     tag: ClassVar[str]
     registry: ClassVar[dict[str, type[TypeDef]]] = {}
     _external_types: ClassVar[dict[type, ExternalTypeRecord[Any]]] = {}
+    _external_version: ClassVar[int] = 0  # bumped on every new registration
+    _public_fields: ClassVar[tuple[Field[Any], ...]] = ()
 
     def __init_subclass__(cls, tag: str | None = None) -> None:
         """Register typedef subclass with automatic tag derivation."""
-        dataclass(frozen=True)(cls)
-        cls.tag = tag if tag is not None else cls.__name__
+        frozen_slotted_dataclass(cls)
+        cls._public_fields = tuple(f for f in fields(cls) if not f.name.startswith("_"))
+        if not fields(cls):
+            # Field-less TypeDefs are immutable and all equal: share one instance.
+            setattr(cls, "__new__", staticmethod(_shared_instance))  # noqa: B010
+        elif cls.__new__ is _shared_instance:
+            # A subclass that adds fields must not inherit the shared instance:
+            # copy and pickle create instances with __new__(cls) alone.
+            setattr(cls, "__new__", staticmethod(_new_instance))  # noqa: B010
+        cls.tag = sys.intern(tag if tag is not None else cls.__name__)
 
         if (existing := TypeDef.registry.get(cls.tag)) and existing is not cls:
             msg = (
@@ -83,6 +106,7 @@ class TypeDef:
             decode=decode,
         )
         cls._external_types[python_type] = record
+        TypeDef._external_version += 1
         return python_type
 
     @classmethod
@@ -94,6 +118,20 @@ class TypeDef:
         return None
 
 
+def _shared_instance[T](cls: type[T], *_args: Any, **_kwargs: Any) -> T:
+    """Return the one shared instance of a field-less TypeDef (its ``__new__``)."""
+    instance: T | None = cls.__dict__.get("_instance")
+    if instance is None:
+        instance = object.__new__(cls)
+        type.__setattr__(cls, "_instance", instance)
+    return instance
+
+
+def _new_instance[T](cls: type[T], *_args: Any, **_kwargs: Any) -> T:
+    """Create a fresh instance, for subclasses of field-less TypeDefs."""
+    return object.__new__(cls)
+
+
 class IntType(TypeDef, tag="int"):
     """Integer type."""
 
@@ -236,23 +274,169 @@ class ExternalType(TypeDef, tag="external"):
 
 
 def substitute_type_params(type_expr: Any, substitutions: dict[Any, Any]) -> Any:
-    """Recursively substitute type parameters in a type expression."""
-    if type_expr in substitutions:
-        return substitutions[type_expr]
+    """Recursively substitute type parameters in a type expression.
 
-    origin = get_origin(type_expr)
-    args = get_args(type_expr)
-
-    if origin is None or not args:
+    Subtrees that mention none of the parameters are returned unchanged, and
+    subtrees shared within the expression are substituted only once.
+    """
+    if not substitutions:
         return type_expr
 
-    new_args = tuple(substitute_type_params(arg, substitutions) for arg in args)
+    # Keyed by identity: equality would conflate unions that differ only in
+    # option order, and would hand back an equal but different subtree.
+    items = tuple(substitutions.items())
+    key = (id(type_expr), *(id(obj) for item in items for obj in item))
+    cached = _SUBSTITUTED.get(key)
+    if cached is not None:
+        return cached[2]
 
-    # UnionType (| operator) needs special reconstruction
-    if isinstance(type_expr, types.UnionType):
-        result = new_args[0]
-        for arg in new_args[1:]:
-            result = result | arg
+    # Type parameters compare by identity, so id() keys avoid hashing
+    # (recursively, for generic aliases) every subexpression.
+    by_id = {id(param): value for param, value in items}
+    result = _substitute(type_expr, by_id)
+    if len(_SUBSTITUTED) >= _SUBSTITUTED_MAX:
+        _SUBSTITUTED.clear()
+    # The inputs are stored with the result so their ids stay valid
+    _SUBSTITUTED[key] = (type_expr, items, result)
+    return result
+
+
+# __origin__ of Callable[...] aliases, whose __args__ get_args regroups
+_CALLABLE: Any = abc.Callable
+
+# Results of substitute_type_params keyed by the ids of its inputs
+_SUBSTITUTED: dict[tuple[int, ...], tuple[Any, tuple[tuple[Any, Any], ...], Any]] = {}
+_SUBSTITUTED_MAX = 4096
+
+
+def _substitute(type_expr: Any, by_id: dict[int, Any]) -> Any:
+    """Substitute parameters bottom-up, with an explicit stack of pending work.
+
+    Each subexpression with arguments is visited twice: first to queue its
+    arguments, then, once they are all resolved, to assemble its result.
+    Subexpressions shared within type_expr are resolved only once.
+    """
+    memo: dict[int, Any] = {}
+    # Callable parameter lists are built afresh by get_args and freed once their
+    # parent is assembled; they are kept alive for the whole walk so that a
+    # later list cannot reuse the id their memo entry is keyed on.
+    param_lists: list[list[Any]] = []
+
+    def resolved(expr: Any) -> Any:
+        key = id(expr)
+        if key in by_id:
+            return by_id[key]
+        return memo.get(key, expr)  # leaves are their own result
+
+    stack: list[tuple[Any, tuple[Any, tuple[Any, ...]] | None]] = [(type_expr, None)]
+    # Bound once: these run for every subexpression on the stack
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    no_frame = itertools.repeat(None)
+    while stack:
+        expr, frame = pop()
+        key = id(expr)
+        if key in memo or key in by_id:
+            continue
+        if frame is None:
+            # Leaves: unsubstituted type parameters and classes, whatever their
+            # metaclass (node and TypeDef classes are SlotsMeta instances)
+            expr_class = type(expr)
+            if expr_class is TypeVar or issubclass(expr_class, type):
+                continue
+            # Generic aliases record their free type parameters when created,
+            # so a subtree none of whose parameters are substituted is skipped
+            # without visiting it
+            params = getattr(expr, "__parameters__", None)
+            if params is not None and not any(id(p) in by_id for p in params):
+                memo[key] = expr
+                continue
+            origin, args = _origin_args(expr)
+            push((expr, (origin, args)))
+            extend(zip(args, no_frame, strict=False))
+            continue
+
+        origin, args = frame
+        # Children come back as the same objects when nothing in them changed,
+        # so an unchanged subtree is returned as is rather than rebuilt
+        new_args = _map_args(resolved, args)
+        if new_args is args or origin is None:
+            memo[key] = expr
+        elif type(expr) is list:  # the parameter list of Callable[[...], R]
+            param_lists.append(expr)
+            memo[key] = list(new_args)
+        else:
+            memo[key] = _rebuild(expr, origin, new_args)
+
+    return resolved(type_expr)
+
+
+def _map_args(
+    resolved: Callable[[Any], Any],
+    args: tuple[Any, ...],
+) -> tuple[Any, ...]:
+    """Resolve each argument, returning args itself when none of them changed."""
+    # One and two arguments (list[T], dict[K, V]) are by far the most common
+    if len(args) == 1:
+        first = resolved(args[0])
+        return args if first is args[0] else (first,)
+    if len(args) == 2:  # noqa: PLR2004
+        first, second = resolved(args[0]), resolved(args[1])
+        if first is args[0] and second is args[1]:
+            return args
+        return (first, second)
+    new_args = tuple(map(resolved, args))
+    if all(new is old for new, old in zip(new_args, args, strict=True)):
+        return args
+    return new_args
+
+
+def _origin_args(type_expr: Any) -> tuple[Any, tuple[Any, ...]]:
+    """Get the origin and arguments of a type expression."""
+    # Reading __origin__/__args__ directly skips the generic dispatch in the
+    # typing helpers, which only | unions, Callable and Annotated need here
+    # Builtin generics (list[int], dict[str, T]) are the common case
+    if type(type_expr) is types.GenericAlias:
+        return type_expr.__origin__, type_expr.__args__
+    if type(type_expr) is types.UnionType:
+        return types.UnionType, type_expr.__args__
+    if type(type_expr) is list:  # the parameter list of Callable[[...], R]
+        return list, tuple(type_expr)
+    origin = getattr(type_expr, "__origin__", None)
+    # get_args regroups Callable parameters, and Annotated reports the
+    # annotated type as its __origin__
+    if origin is _CALLABLE or hasattr(type_expr, "__metadata__"):
+        return get_origin(type_expr), get_args(type_expr)
+    return origin, getattr(type_expr, "__args__", ())
+
+
+def _rebuild(type_expr: Any, origin: Any, new_args: tuple[Any, ...]) -> Any:
+    """Subscript origin with new_args, sharing one object per distinct result."""
+    # A Callable flattens its parameter list into its own arguments, so it does
+    # not keep the list alive and the list's id cannot serve as a key
+    if origin is _CALLABLE and any(type(arg) is list for arg in new_args):
+        return origin[new_args]
+    # Arguments are keyed by identity, like the substitution inputs; a live
+    # alias keeps its arguments alive, so their ids cannot be reused
+    key = (id(origin), *map(id, new_args))
+    result = _REBUILT.get(key)
+    if result is not None:
         return result
+    # UnionType (| operator) cannot be subscripted; build the equivalent
+    # typing.Union in one step instead of folding | over the options
+    is_union = type(type_expr) is types.UnionType
+    result = Union[new_args] if is_union else origin[new_args]  # noqa: UP007
+    with contextlib.suppress(TypeError):  # not every result supports weakrefs
+        _REBUILT[key] = result
+    return result
+
+
+# Generic aliases built by substitution, keyed by the ids of origin and args
+_REBUILT: weakref.WeakValueDictionary[tuple[int, ...], Any] = (
+    weakref.WeakValueDictionary()
+)
+
 
-    return origin[new_args]
+def clear_substitution_caches() -> None:
+    """Drop memoized substitution results and shared rebuilt aliases."""
+    _SUBSTITUTED.clear()
+    _REBUILT.clear()
@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+import importlib
+
+import pytest
+
+from typedsl import _json
+from typedsl.nodes import Node
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> str:
+    """Run a test with each JSON backend; orjson is skipped when not installed."""
+    backend: str = request.param
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(_json, "_orjson", importlib.import_module("orjson"))
+    else:
+        monkeypatch.setattr(_json, "_orjson", None)
+    # Each run defines the test's node classes again under the same tags
+    monkeypatch.setattr(Node, "registry", dict(Node.registry))
+    return backend
@@ -1,5 +1,8 @@
 """Tests for typedsl.adapters module."""
 
+import datetime
+from typing import ClassVar, NamedTuple
+
 import pytest
 
 from typedsl.adapters import JSONAdapter
@@ -14,6 +17,7 @@ from typedsl.types import (
     NodeType,
     RefType,
     StrType,
+    TypeDef,
     UnionType,
 )
 
@@ -137,6 +141,58 @@ class TestJSONAdapterSerializeNode:
         assert result == {"tag": "private_field_adapter", "public_value": 42}
         assert "_private_value" not in result
 
+    def test_serializer_is_compiled_once_per_class(self) -> None:
+        """Test that the generated serializer is cached on the node class."""
+
+        class Compiled(Node[int], tag="compiled_serializer_adapter"):
+            left: int
+            right: str
+
+        adapter = JSONAdapter()
+        first = adapter.serialize_node(Compiled(left=1, right="a"))
+        serializer = Compiled.__dict__["_serializer"]
+        second = adapter.serialize_node(Compiled(left=2, right="b"))
+
+        assert first == {"tag": "compiled_serializer_adapter", "left": 1, "right": "a"}
+        assert second == {"tag": "compiled_serializer_adapter", "left": 2, "right": "b"}
+        assert Compiled.__dict__["_serializer"] is serializer
+
+    def test_serializer_uses_adapter_value_hook(self) -> None:
+        """Test that subclasses overriding _serialize_value still take effect."""
+
+        class Upper(JSONAdapter):
+            def _serialize_value(self, value: object) -> object:
+                if isinstance(value, str):
+                    return value.upper()
+                return super()._serialize_value(value)
+
+        class Named(Node[str], tag="hooked_serializer_adapter"):
+            name: str
+
+        for adapter in (Upper(), Upper(compact=True)):
+            result = adapter.serialize_node(Named(name="abc"))
+            assert result == {"tag": "hooked_serializer_adapter", "name": "ABC"}
+
+    def test_subclass_serializer_bases_stay_local(self) -> None:
+        """Test that a subclass's extra serializers do not leak to JSONAdapter."""
+
+        def serialize_date(_adapter: JSONAdapter, value: datetime.date) -> str:
+            return value.isoformat()
+
+        class DateAware(JSONAdapter):
+            _serializer_bases: ClassVar = (
+                (datetime.date, serialize_date),
+                *JSONAdapter._serializer_bases,  # noqa: SLF001
+            )
+
+        class Dated(Node[int], tag="dated_serializer_adapter"):
+            when: datetime.date
+
+        node = Dated(when=datetime.date(2020, 1, 1))
+
+        assert DateAware().serialize_node(node)["when"] == "2020-01-01"
+        assert JSONAdapter().serialize_node(node)["when"] == node.when
+
 
 class TestJSONAdapterDeserializeNode:
     """Test JSONAdapter.deserialize_node() method."""
@@ -243,6 +299,57 @@ class TestJSONAdapterDeserializeNode:
         # optional field gets default value
         assert result.optional is None
 
+    def test_deserializer_is_compiled_once_per_class(self) -> None:
+        """Test that the generated deserializer is cached on the node class."""
+
+        class Pair(Node[int], tag="compiled_deser"):
+            left: int
+            right: int = 0
+
+        adapter = JSONAdapter()
+        full = adapter.deserialize_node(
+            {"tag": "compiled_deser", "left": 1, "right": 2},
+        )
+        deserializer = Pair.__dict__["_deserializer"]
+        partial = adapter.deserialize_node({"tag": "compiled_deser", "left": 3})
+
+        assert full == Pair(left=1, right=2)
+        assert partial == Pair(left=3)
+        assert Pair.__dict__["_deserializer"] is deserializer
+
+    def test_deserialize_runs_custom_initialization(self) -> None:
+        """Test that __post_init__, __init__ and private defaults still run."""
+
+        class Checked(Node[int], tag="deser_post_init"):
+            value: int
+
+            def __post_init__(self) -> None:
+                if self.value < 0:
+                    msg = "negative"
+                    raise ValueError(msg)
+
+        class Doubled(Node[int], tag="deser_custom_init"):
+            value: int
+
+            def __init__(self, value: int) -> None:
+                object.__setattr__(self, "value", value * 2)
+
+        class Private(Node[int], tag="deser_private_default"):
+            value: int
+            _cache: int = -1
+
+        adapter = JSONAdapter()
+        with pytest.raises(ValueError, match="negative"):
+            adapter.deserialize_node({"tag": "deser_post_init", "value": -1})
+        doubled = adapter.deserialize_node({"tag": "deser_custom_init", "value": 2})
+        private = adapter.deserialize_node(
+            {"tag": "deser_private_default", "value": 1},
+        )
+
+        assert doubled == Doubled(2)
+        assert private == Private(value=1)
+        assert private._cache == -1  # noqa: SLF001
+
 
 class TestJSONAdapterSerializeTypeDef:
     """Test JSONAdapter.serialize_typedef() method."""
@@ -452,6 +559,80 @@ class TestJSONAdapterSerializeNodeSchema:
         assert result["type_params"][0]["name"] == "T"
 
 
+class TestJSONAdapterCompact:
+    """Test JSONAdapter(compact=True) TypeDef output."""
+
+    def test_serialize_compact_typedef(self) -> None:
+        """Test that compact mode shortens TypeDef tags and keys."""
+        adapter = JSONAdapter(compact=True)
+        typedef = DictType(key=StrType(), value=ListType(element=IntType()))
+
+        assert adapter.serialize_typedef(typedef) == {
+            "t": "d",
+            "k": {"t": "s"},
+            "v": {"t": "l", "e": {"t": "i"}},
+        }
+
+    def test_compact_keeps_unmapped_tags(self) -> None:
+        """Test that tags without a short form are emitted unchanged."""
+        adapter = JSONAdapter(compact=True)
+        assert adapter.serialize_typedef(BoolType()) == {"t": "bool"}
+
+    def test_compact_typedef_round_trip(self) -> None:
+        """Test that compact TypeDef dicts deserialize to the original."""
+        adapter = JSONAdapter(compact=True)
+        original = DictType(
+            key=StrType(),
+            value=ListType(element=NodeType(returns=FloatType())),
+        )
+
+        serialized = adapter.serialize_typedef(original)
+        assert adapter.deserialize_typedef(serialized) == original
+
+    def test_compact_node_schema(self) -> None:
+        """Test that node schemas use compact TypeDefs but keep node tags."""
+
+        class CompactNode(Node[int], tag="compact_schema"):
+            items: list[str]
+
+        result = JSONAdapter(compact=True).serialize_node_schema(
+            node_schema(CompactNode),
+        )
+
+        assert result["tag"] == "compact_schema"
+        assert result["returns"] == {"t": "i"}
+        assert result["fields"][0] == {
+            "name": "items",
+            "type": {"t": "l", "e": {"t": "s"}},
+        }
+
+    def test_compact_node_with_typedef_field_round_trip(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that TypeDefs held by node fields keep their full form."""
+        # TypeDef fields have no schema, so keep Holder out of all_schemas()
+        monkeypatch.setattr(Node, "registry", dict(Node.registry))
+
+        class Holder(Node[int], tag="compact_typedef_holder"):
+            typedef: TypeDef
+            options: list[TypeDef]
+            plain: dict[str, str]
+            lookalike: dict[str, str]
+
+        adapter = JSONAdapter(compact=True)
+        original = Holder(
+            typedef=ListType(element=IntType()),
+            options=[BoolType(), DictType(key=StrType(), value=FloatType())],
+            plain={"t": "i"},
+            lookalike={"t": "list", "e": "x"},
+        )
+
+        serialized = adapter.serialize_node(original)
+        assert serialized["typedef"] == {"tag": "list", "element": {"tag": "int"}}
+        assert adapter.deserialize_node(serialized) == original
+
+
 class TestJSONAdapterRoundTrip:
     """Test round-trip serialization through JSONAdapter."""
 
@@ -556,6 +737,21 @@ class TestJSONAdapterPrivateMethods:
             {"tag": "item_list_private", "value": 2},
         ]
 
+    def test_serialize_value_with_container_subclasses(self) -> None:
+        """Test that subclasses of containers dispatch like their bases."""
+
+        class Point(NamedTuple):
+            x: int
+            y: int
+
+        class Tagged(dict[str, int]):
+            pass
+
+        adapter = JSONAdapter()
+
+        assert adapter._serialize_value(Point(1, 2)) == [1, 2]  # noqa: SLF001
+        assert adapter._serialize_value(Tagged(a=1)) == {"a": 1}  # noqa: SLF001
+
     def test_deserialize_value_with_nested_dicts(self) -> None:
         """Test _deserialize_value handles nested dicts correctly."""
 
@@ -1,5 +1,6 @@
 """Tests for typedsl.ast module."""
 
+import io
 import json
 from typing import Any
 
@@ -155,9 +156,40 @@ class TestASTResolve:
         assert resolved.text == "hello"
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestASTSerialization:
     """Test AST serialization methods."""
 
+    def test_to_json_stream_matches_to_dict(self) -> None:
+        """Test that streamed JSON decodes to the same document as to_dict."""
+
+        class Num(Node[int], tag="num_ast_stream"):
+            value: int
+
+        class Sum(Node[int], tag="sum_ast_stream"):
+            left: Ref[Node[int]]
+            right: Ref[Node[int]]
+
+        ast = AST(
+            root="s",
+            nodes={
+                "a": Num(value=1),
+                "b": Num(value=2),
+                "s": Sum(left=Ref(id="a"), right=Ref(id="b")),
+            },
+        )
+        buffer = io.BytesIO()
+        ast.to_json_stream(buffer)
+
+        assert json.loads(buffer.getvalue()) == ast.to_dict()
+
+    def test_to_json_stream_empty_ast(self) -> None:
+        """Test streaming an AST without nodes."""
+        buffer = io.BytesIO()
+        AST(root="", nodes={}).to_json_stream(buffer)
+
+        assert json.loads(buffer.getvalue()) == {"root": "", "nodes": {}}
+
     def test_to_dict_simple(self) -> None:
         """Test serializing simple AST to dict."""
 
@@ -229,6 +261,7 @@ class TestASTSerialization:
         assert "\n" in json_str
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestASTDeserialization:
     """Test AST deserialization methods."""
 
@@ -348,6 +381,7 @@ class TestASTDeserialization:
         assert isinstance(result_node, Expr)
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestASTRoundTrip:
     """Test round-trip serialization of AST."""
 
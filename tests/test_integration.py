@@ -1,5 +1,8 @@
 """Integration tests for typeDSL - end-to-end workflows."""
 
+import json
+from typing import Annotated
+
 import pytest
 
 from typedsl import (
@@ -9,20 +12,37 @@ from typedsl import (
     NodeRef,
     Ref,
     all_schemas,
+    all_schemas_json,
     from_json,
     node_schema,
+    node_schema_json,
     to_json,
 )
+from typedsl.adapters import JSONAdapter
 from typedsl.types import (
     FloatType,
     IntType,
     ListType,
     NodeType,
+    NoneType,
     RefType,
     StrType,
 )
 
 
+class ForwardBlock(Node[None], tag="forward_ref_block"):
+    """Node whose field refers to a node class defined after it."""
+
+    body: list["ForwardStmt"]
+
+
+class ForwardStmt(Node[None], tag="forward_ref_stmt"):
+    """Node referred to by name from ForwardBlock."""
+
+    label: str
+
+
+@pytest.mark.usefixtures("json_backend")
 class TestCompleteExpressionTreeWorkflow:
     """Test complete workflow: define nodes, build tree, serialize, deserialize."""
 
@@ -90,6 +110,7 @@ class TestCompleteExpressionTreeWorkflow:
         assert restored == expr
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestASTWithReferencesWorkflow:
     """Test complete workflow using AST with references."""
 
@@ -274,6 +295,68 @@ class TestSchemaRegistryWorkflow:
         assert schema_a.tag == "node_a_registry"
         assert len(schema_a.fields) == 1
 
+    def test_node_schema_is_cached_per_class(self) -> None:
+        """Test that repeated node_schema calls return the cached schema."""
+
+        class CachedNode(Node[int], tag="cached_schema_node"):
+            x: int
+
+        assert node_schema(CachedNode) is node_schema(CachedNode)
+
+    def test_node_schema_strips_annotated(self) -> None:
+        """Test that Annotated field metadata is dropped from the schema."""
+
+        class AnnotatedNode(Node[int], tag="annotated_field_node"):
+            x: Annotated[int, "meta"]
+
+        assert node_schema(AnnotatedNode).fields[0].type == IntType()
+
+    def test_node_schema_none_annotation(self) -> None:
+        """Test that a field annotated None gets the none type."""
+
+        class NoneFieldNode(Node[int], tag="none_field_node"):
+            x: None
+
+        assert node_schema(NoneFieldNode).fields[0].type == NoneType()
+
+    def test_node_schema_nested_forward_reference(self) -> None:
+        """Test that forward references inside generics are resolved."""
+        schema = node_schema(ForwardBlock)
+        assert schema.fields[0].type == ListType(element=NodeType(returns=NoneType()))
+
+    def test_all_schemas_sees_newly_registered_nodes(self) -> None:
+        """Test that all_schemas picks up nodes defined after a previous call."""
+        all_schemas()
+
+        class LateNode(Node[int], tag="late_registered_node"):
+            x: int
+
+        assert "late_registered_node" in all_schemas()
+
+    def test_node_schema_json_matches_adapter_output(self) -> None:
+        """Test that node_schema_json encodes the serialized schema once."""
+
+        class EncodedNode(Node[int], tag="encoded_schema_node"):
+            x: int
+
+        encoded = node_schema_json(EncodedNode)
+        expected = JSONAdapter().serialize_node_schema(node_schema(EncodedNode))
+        assert json.loads(encoded) == expected
+        assert node_schema_json(EncodedNode) is encoded
+
+    def test_all_schemas_json_tracks_registry(self) -> None:
+        """Test that all_schemas_json is cached until a new node registers."""
+        encoded = all_schemas_json()
+        assert all_schemas_json() is encoded
+        assert json.loads(encoded).keys() == all_schemas().keys()
+
+        class BatchNode(Node[int], tag="batch_encoded_node"):
+            x: int
+
+        decoded = json.loads(all_schemas_json())
+        expected = JSONAdapter().serialize_node_schema(node_schema(BatchNode))
+        assert decoded["batch_encoded_node"] == expected
+
 
 class TestTypeExtractionWorkflow:
     """Test type extraction and introspection."""
@@ -304,6 +387,18 @@ class TestTypeExtractionWorkflow:
         assert isinstance(fields_by_name["node_field"].returns, FloatType)
         assert isinstance(fields_by_name["ref_field"], RefType)
 
+    def test_extract_string_annotated_field_types(self) -> None:
+        """Test that string annotations are still resolved for schemas."""
+
+        class QuotedNode(Node[int], tag="quoted_annotation_node"):
+            value: "int"
+            items: "list[str]"
+
+        schema = node_schema(QuotedNode)
+        assert isinstance(schema.fields[0].type, IntType)
+        assert isinstance(schema.fields[1].type, ListType)
+        assert isinstance(schema.fields[1].type.element, StrType)
+
 
 class TestEndToEndUserScenarios:
     """Test realistic end-to-end user scenarios."""
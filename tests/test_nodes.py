@@ -1,5 +1,11 @@
 """Tests for typedsl.nodes module."""
 
+import abc
+import copy
+import dataclasses
+import functools
+import weakref
+
 import pytest
 
 from typedsl.nodes import Child, Node, NodeRef, Ref
@@ -41,6 +47,100 @@ class TestNodeBasics:
         assert node.active is True
 
 
+class TestNodeSlots:
+    """Test that Node instances use __slots__."""
+
+    def test_instances_have_no_dict(self) -> None:
+        """Test that node instances carry no per-instance __dict__."""
+
+        class SlottedNode(Node[int], tag="slotted_node"):
+            value: int
+            label: str = "x"
+
+        node = SlottedNode(value=1)
+        assert not hasattr(node, "__dict__")
+        assert node.label == "x"
+
+    def test_inherited_fields_and_copy(self) -> None:
+        """Test that slotted node subclasses keep base fields and copy cleanly."""
+
+        class BaseSlotted(Node[int], tag="base_slotted_node"):
+            left: int
+
+        class DerivedSlotted(BaseSlotted, tag="derived_slotted_node"):
+            right: int = 2
+
+        node = DerivedSlotted(left=1)
+        assert (node.left, node.right) == (1, 2)
+        assert copy.deepcopy(node) == node
+        assert dataclasses.replace(node, right=3).right == 3
+
+    def test_dict_can_be_requested(self) -> None:
+        """Test that a subclass can opt back into a __dict__."""
+
+        class CachingNode(Node[int], tag="caching_slotted_node"):
+            __slots__ = ("__dict__",)
+            value: int
+
+            @functools.cached_property
+            def doubled(self) -> int:
+                return self.value * 2
+
+        assert CachingNode(value=2).doubled == 4
+
+    def test_instances_support_weakrefs(self) -> None:
+        """Test that slotted nodes keep a __weakref__ slot."""
+
+        class WeakNode(Node[int], tag="weak_slotted_node"):
+            value: int
+
+        node = WeakNode(value=1)
+        assert weakref.ref(node)() is node
+
+    def test_abc_mixin(self) -> None:
+        """Test that node hierarchies can still mix in abc.ABC."""
+
+        class Expr(Node[int], abc.ABC, tag="abc_expr_node"):
+            @abc.abstractmethod
+            def evaluate(self) -> int: ...
+
+        class Const(Expr, tag="abc_const_node"):
+            value: int
+
+            def evaluate(self) -> int:
+                return self.value
+
+        with pytest.raises(TypeError, match="abstract"):
+            Expr()  # type: ignore[abstract]
+        assert Const(value=3).evaluate() == 3
+
+    def test_bases_with_fields_cannot_be_combined(self) -> None:
+        """Test that two slotted bases with fields conflict under inheritance."""
+
+        class Left(Node[int], tag="left_slotted_base"):
+            a: int
+
+        class Right(Node[int], tag="right_slotted_base"):
+            b: int
+
+        with pytest.raises(TypeError, match="lay-out conflict"):
+
+            class Both(Left, Right, tag="both_slotted_bases"):
+                pass
+
+    def test_inherited_field_assigned_without_annotation(self) -> None:
+        """Test that reassigning an inherited field in a subclass body is harmless."""
+
+        class Defaulted(Node[int], tag="defaulted_slotted_node"):
+            x: int = 1
+
+        class Shadowing(Defaulted, tag="shadowing_slotted_node"):
+            x = 3
+
+        assert Shadowing().x == 1  # the dataclass field default still applies
+        assert Shadowing(x=2).x == 2
+
+
 class TestNodeTags:
     """Test Node tag generation and registration."""
 
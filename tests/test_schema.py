@@ -1,13 +1,21 @@
 """Tests for typedsl.schema module."""
 
 import datetime
+import json
 from collections.abc import Mapping, Sequence
 from decimal import Decimal
-from typing import TypeVar
+from typing import Literal, TypeVar
 
 import pytest
 
-from typedsl.schema import extract_type
+from typedsl import Node, schema
+from typedsl.schema import (
+    all_schemas,
+    clear_caches,
+    extract_type,
+    node_schema,
+    node_schema_json,
+)
 from typedsl.types import (
     BoolType,
     BytesType,
@@ -16,17 +24,21 @@ from typedsl.types import (
     DecimalType,
     DictType,
     DurationType,
+    ExternalType,
     FloatType,
     FrozenSetType,
     IntType,
     ListType,
+    LiteralType,
     MappingType,
     NoneType,
     SequenceType,
     StrType,
     TimeType,
+    TypeDef,
     TypeParameter,
     UnionType,
+    substitute_type_params,
 )
 
 # PEP 695 type alias for testing generic type alias extraction
@@ -336,3 +348,121 @@ class TestEdgeCases:
     def test_dict_with_wrong_arg_count_raises(self) -> None:
         """Test that dict with wrong number of args raises ValueError."""
         # This is also hard to test as Python's typing system enforces this
+
+
+class TestExtractTypeCaching:
+    """Test memoization of extract_type."""
+
+    def test_repeated_extraction_returns_cached_instance(self) -> None:
+        """Test that extracting the same annotation twice reuses the result."""
+        assert extract_type(list[int]) is extract_type(list[int])
+
+    def test_primitive_extraction_shares_instance(self) -> None:
+        """Test that primitive annotations map to one shared TypeDef instance."""
+        assert extract_type(int) is extract_type(int)
+        result = extract_type(list[int])
+        assert isinstance(result, ListType)
+        assert result.element is extract_type(int)
+
+    def test_equal_composites_share_instance(self) -> None:
+        """Test that annotations producing the same TypeDef share one instance."""
+        assert extract_type(StrKeyDict[int]) is extract_type(dict[str, int])
+
+    def test_literal_bool_and_int_not_conflated(self) -> None:
+        """Test that value-equal literals stay distinct when shared."""
+        int_list = extract_type(list[Literal[1]])
+        bool_list = extract_type(list[Literal[True]])
+        assert int_list is not bool_list
+        assert isinstance(bool_list, ListType)
+        assert isinstance(bool_list.element, LiteralType)
+        assert bool_list.element.values == (True,)
+        assert type(bool_list.element.values[0]) is bool
+
+    def test_union_option_order_preserved_across_cache(self) -> None:
+        """Test that equal unions with different option order stay distinct."""
+        first = extract_type(int | str)
+        second = extract_type(str | int)
+        assert isinstance(first, UnionType)
+        assert isinstance(second, UnionType)
+        assert isinstance(first.options[0], IntType)
+        assert isinstance(second.options[0], StrType)
+
+    def test_clear_caches_forces_fresh_extraction(self) -> None:
+        """Test that clear_caches drops memoized composite TypeDefs."""
+        before = extract_type(list[int])
+        clear_caches()
+        after = extract_type(list[int])
+        assert after == before
+        assert after is not before
+        assert extract_type(list[int]) is after
+
+    def test_clear_caches_drops_substitutions(self) -> None:
+        """Test that clear_caches also drops memoized type substitutions."""
+        T = TypeVar("T")
+        expr = list[dict[str, T]]
+        before = substitute_type_params(expr, {T: int})
+        clear_caches()
+        after = substitute_type_params(expr, {T: int})
+        assert after == before
+        assert after is not before
+
+    def test_interning_table_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the TypeDef interning table stays within its limit."""
+        monkeypatch.setattr(schema, "_INTERNED_MAX", 2)
+        clear_caches()
+        for py_type in (list[int], list[str], set[int], dict[str, int]):
+            result = extract_type(py_type)
+            assert result == extract_type(py_type)
+        assert len(schema._INTERNED) <= 2  # noqa: SLF001
+
+    def test_registered_external_type_takes_precedence(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that registering a built-in type overrides earlier extractions."""
+        assert extract_type(Decimal) == DecimalType()
+        assert extract_type(list[Decimal]) == ListType(element=DecimalType())
+
+        # Both are restored after the test, which brings the built-in mapping back
+        monkeypatch.setattr(TypeDef, "_external_types", {})
+        monkeypatch.setattr(
+            TypeDef,
+            "_external_version",
+            TypeDef._external_version,  # noqa: SLF001
+        )
+        TypeDef.register(Decimal, encode=lambda d: {"v": str(d)}, decode=Decimal)
+
+        external = ExternalType(module="decimal", name="Decimal")
+        assert extract_type(Decimal) == external
+        assert extract_type(list[Decimal]) == ListType(element=external)
+
+    def test_registration_refreshes_node_schemas(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that schemas cached on node classes follow a new registration."""
+
+        class Dated(Node[int], tag="external_refresh_dated"):
+            d: datetime.date
+
+        assert node_schema(Dated).fields[0].type == DateType()
+        node_schema_json(Dated)
+        all_schemas()
+
+        monkeypatch.setattr(TypeDef, "_external_types", {})
+        monkeypatch.setattr(
+            TypeDef,
+            "_external_version",
+            TypeDef._external_version,  # noqa: SLF001
+        )
+        TypeDef.register(
+            datetime.date,
+            encode=lambda d: {"v": d.isoformat()},
+            decode=lambda data: datetime.date.fromisoformat(data["v"]),
+        )
+
+        external = ExternalType(module="datetime", name="date")
+        assert node_schema(Dated).fields[0].type == external
+        assert all_schemas()["external_refresh_dated"].fields[0].type == external
+        encoded = json.loads(node_schema_json(Dated))
+        assert encoded["fields"][0]["type"]["tag"] == "external"
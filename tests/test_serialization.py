@@ -1,6 +1,8 @@
 """Tests for typedsl.serialization module."""
 
+import datetime
 import json
+import math
 
 import pytest
 
@@ -341,6 +343,7 @@ class TestRoundTripSerialization:
         assert deserialized == original
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestToJson:
     """Test to_json() JSON string serialization."""
 
@@ -388,6 +391,7 @@ class TestToJson:
         }
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestFromJson:
     """Test from_json() JSON string deserialization."""
 
@@ -445,6 +449,7 @@ class TestFromJson:
         assert result.id == "node-999"
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestJsonRoundTrip:
     """Test full JSON round-trip (to_json -> from_json)."""
 
@@ -491,6 +496,42 @@ class TestJsonRoundTrip:
 
         assert deserialized == original
 
+    def test_non_finite_floats_round_trip(self) -> None:
+        """Test that NaN and infinities survive a JSON round trip."""
+
+        class Measure(Node[float], tag="measure_json_non_finite"):
+            value: float
+            fallback: float | None = None
+
+        restored = from_json(to_json(Measure(value=float("nan"))))
+        assert isinstance(restored, Measure)
+        assert math.isnan(restored.value)
+        assert restored.fallback is None
+        assert from_json(to_json(Measure(value=float("-inf")))) == Measure(
+            value=float("-inf"),
+        )
+
+    def test_non_json_value_raises_error(self) -> None:
+        """Test that values the json module cannot encode are still rejected."""
+
+        class Dated(Node[str], tag="dated_json_unsupported"):
+            day: datetime.date
+
+        with pytest.raises(TypeError):
+            to_json(Dated(day=datetime.date(2024, 1, 1)))
+
+    def test_non_ascii_and_int_keys_round_trip(self) -> None:
+        """Test that non-ASCII text and non-string keys decode identically."""
+
+        class Labels(Node[str], tag="labels_json_round_trip"):
+            names: dict[int, str]
+
+        original = Labels(names={1: "café", 2: "naïve"})
+        assert json.loads(to_json(original)) == {
+            "tag": "labels_json_round_trip",
+            "names": {"1": "café", "2": "naïve"},
+        }
+
 
 class TestSerializationEdgeCases:
     """Test edge cases in serialization."""
@@ -543,6 +584,15 @@ class TestSerializationEdgeCases:
         with pytest.raises(ValueError, match="Cannot serialize"):
             to_dict(obj)  # type: ignore[arg-type]
 
+    def test_serialize_node_class_raises_error(self) -> None:
+        """Test that passing a node class rather than an instance is rejected."""
+
+        class ClassOnly(Node[int], tag="class_only_serial"):
+            value: int
+
+        with pytest.raises(ValueError, match="Cannot serialize"):
+            to_dict(ClassOnly)  # type: ignore[arg-type]
+
 
 class TestSerializationTypes:
     """Test serialization preserves type information."""
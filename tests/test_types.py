@@ -1,5 +1,13 @@
 """Tests for typedsl.types module."""
 
+import abc
+import copy
+import pickle
+import sys
+import weakref
+from collections.abc import Callable
+from typing import Annotated, TypeVar, get_args, get_origin
+
 import pytest
 
 from typedsl.types import (
@@ -29,8 +37,12 @@ from typedsl.types import (
     TypeParameter,
     TypeParameterRef,
     UnionType,
+    substitute_type_params,
 )
 
+T = TypeVar("T")
+U = TypeVar("U")
+
 
 class TestPrimitiveTypes:
     """Test concrete primitive types."""
@@ -66,6 +78,26 @@ class TestPrimitiveTypes:
         with pytest.raises((AttributeError, TypeError)):
             it.tag = "other"
 
+    def test_primitive_types_are_shared_instances(self) -> None:
+        """Test that field-less types construct a single shared instance."""
+        assert IntType() is IntType()
+        assert DateType() is DateType()
+        assert IntType() is not FloatType()
+
+    def test_subclass_with_fields_is_not_shared(self) -> None:
+        """Test that copies of a field-adding subclass stay independent."""
+
+        class SizedInt(IntType, tag="sized_int_shared"):
+            bits: int = 32
+
+        original = SizedInt(bits=8)
+        copied = copy.copy(original)
+        SizedInt()
+
+        assert copied == SizedInt(bits=8)
+        assert copied is not original
+        assert IntType() is IntType()
+
 
 class TestBinaryAndPrecisionTypes:
     """Test binary and precision types."""
@@ -276,9 +308,56 @@ class TestTypeParameter:
             tp.name = "U"
 
 
+class TestTypeDefSlots:
+    """Test that TypeDef instances use __slots__."""
+
+    def test_instances_have_no_dict(self) -> None:
+        """Test that TypeDef instances carry no per-instance __dict__."""
+        assert not hasattr(ListType(element=IntType()), "__dict__")
+        assert not hasattr(TypeParameter(name="T"), "__dict__")
+
+    def test_default_preserved_with_slots(self) -> None:
+        """Test that field defaults still apply on slotted TypeDefs."""
+        assert TypeParameter(name="T").bound is None
+
+    def test_copy_and_pickle_round_trip(self) -> None:
+        """Test that slotted frozen TypeDefs survive copy and pickle."""
+        original = DictType(key=StrType(), value=ListType(element=IntType()))
+        assert copy.deepcopy(original) == original
+        assert pickle.loads(pickle.dumps(original)) == original  # noqa: S301
+
+    def test_instances_support_weakrefs(self) -> None:
+        """Test that slotted TypeDefs keep a __weakref__ slot."""
+        typedef = ListType(element=IntType())
+        assert weakref.ref(typedef)() is typedef
+
+    def test_abc_mixin(self) -> None:
+        """Test that TypeDef subclasses can still mix in abc.ABC."""
+
+        class Shaped(TypeDef, abc.ABC, tag="shaped_abc"):
+            @abc.abstractmethod
+            def rank(self) -> int: ...
+
+        class Matrix(Shaped, tag="matrix_abc"):
+            element: TypeDef
+
+            def rank(self) -> int:
+                return 2
+
+        with pytest.raises(TypeError, match="abstract"):
+            Shaped()  # type: ignore[abstract]
+        assert Matrix(element=IntType()).rank() == 2
+        assert not hasattr(Matrix(element=IntType()), "__dict__")
+
+
 class TestTypeDefRegistry:
     """Test TypeDef registry functionality."""
 
+    def test_public_fields_cached_on_class(self) -> None:
+        """Test that each TypeDef class records its public fields once."""
+        assert [f.name for f in DictType._public_fields] == ["key", "value"]  # noqa: SLF001
+        assert IntType._public_fields == ()  # noqa: SLF001
+
     def test_type_registry_contains_types(self) -> None:
         """Test that type registry contains all type definitions."""
         assert "int" in TypeDef.registry
@@ -371,3 +450,91 @@ class TestNestedTypes:
         assert len(ut.options) == 2
         assert isinstance(ut.options[0], ListType)
         assert isinstance(ut.options[1], DictType)
+
+
+class TestSubstituteTypeParams:
+    """Test substituting type parameters in type expressions."""
+
+    def test_substitute_nested(self) -> None:
+        """Test substituting T inside nested generics."""
+        result = substitute_type_params(list[dict[str, T]], {T: int})
+        assert result == list[dict[str, int]]
+
+    def test_substitute_union(self) -> None:
+        """Test substituting T inside a | union keeps option order."""
+        result = substitute_type_params(T | None, {T: str})
+        assert result == str | None
+        assert result.__args__ == (str, type(None))
+
+    def test_substitute_inside_annotated(self) -> None:
+        """Test that Annotated keeps its metadata when T is substituted."""
+        result = substitute_type_params(Annotated[list[T], "meta"], {T: int})
+        assert result == Annotated[list[int], "meta"]
+
+    def test_substitute_callable_parameters(self) -> None:
+        """Test substituting T inside the parameter list of a Callable."""
+        result = substitute_type_params(Callable[[T, int], T], {T: str})
+        assert result == Callable[[str, int], str]
+
+    def test_substitute_sibling_callables(self) -> None:
+        """Test that each Callable's parameter list is substituted on its own."""
+        callables = [
+            Callable[[int, int, int], T],
+            Callable[[T, int, U], T],
+            Callable[[U, str], int],
+            Callable[[int, int, int], U],
+        ]
+        expected = tuple[
+            Callable[[int, int, int], bytes],
+            Callable[[bytes, int, float], bytes],
+            Callable[[float, str], int],
+            Callable[[int, int, int], float],
+        ]
+        for _ in range(50):
+            result = substitute_type_params(tuple[*callables], {T: bytes, U: float})
+            assert result == expected
+            # Fresh aliases each round, so freed parameter lists can be reused
+            callables = [Callable[get_args(c)[0], get_args(c)[1]] for c in callables]
+
+    def test_substitute_beyond_recursion_limit(self) -> None:
+        """Test that nesting deeper than the recursion limit is substituted."""
+        expr: object = T
+        for _ in range(sys.getrecursionlimit() + 100):
+            expr = list[expr]  # type: ignore[valid-type]
+        result = substitute_type_params(expr, {T: int})
+        while result is not int:
+            assert get_origin(result) is list
+            (result,) = get_args(result)
+
+    def test_untouched_subtree_returned_as_is(self) -> None:
+        """Test that subtrees without parameters are not rebuilt."""
+        inner = dict[str, int]
+        result = substitute_type_params(tuple[inner, T], {T: float})
+        assert result == tuple[dict[str, int], float]
+        assert result.__args__[0] is inner
+
+    def test_empty_substitutions_return_expression(self) -> None:
+        """Test that nothing is rebuilt when there is nothing to substitute."""
+        expr = dict[str, list[T]]
+        assert substitute_type_params(expr, {}) is expr
+
+    def test_repeated_substitution_is_cached(self) -> None:
+        """Test that the same expression and parameters reuse the result."""
+        expr = list[dict[str, T]]
+        first = substitute_type_params(expr, {T: int})
+        assert substitute_type_params(expr, {T: int}) is first
+        assert substitute_type_params(expr, {T: str}) == list[dict[str, str]]
+
+    def test_rebuilt_aliases_are_shared(self) -> None:
+        """Test that equal substitutions of different expressions share objects."""
+        first = substitute_type_params(list[dict[str, T]], {T: int})
+        second = substitute_type_params(set[dict[str, T]], {T: int})
+        assert first.__args__[0] is second.__args__[0]
+
+    def test_cache_distinguishes_union_order(self) -> None:
+        """Test that equal unions with different option order are not shared."""
+        expr = list[T]
+        first = substitute_type_params(expr, {T: int | str})
+        second = substitute_type_params(expr, {T: str | int})
+        assert first.__args__[0].__args__ == (int, str)
+        assert second.__args__[0].__args__ == (str, int)